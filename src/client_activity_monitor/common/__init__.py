@@ -1,4 +1,3 @@
-from .clipboard_utils import copy_to_clipboard, copy_file_path
 from .validators import Validators
 from .exceptions import (
     ClientActivityMonitorError,
@@ -8,7 +7,6 @@ from .exceptions import (
     ReportGenerationError,
     ExternalIntegrationError
 )
-from .error_handler import handle_errors, get_user_friendly_error
 
 __all__ = [
     "copy_to_clipboard",
@@ -22,4 +20,15 @@ __all__ = [
     "ExternalIntegrationError",
     "handle_errors",
     "get_user_friendly_error"
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    # Defer pyperclip/loguru imports until clipboard or error helpers are used
+    if name in ("copy_to_clipboard", "copy_file_path"):
+        from . import clipboard_utils
+        return getattr(clipboard_utils, name)
+    if name in ("handle_errors", "get_user_friendly_error"):
+        from . import error_handler
+        return getattr(error_handler, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
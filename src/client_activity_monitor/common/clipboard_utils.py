@@ -1,3 +1,4 @@
+import os
 import pyperclip
 from pathlib import Path
 from loguru import logger
@@ -14,7 +15,7 @@ def copy_to_clipboard(text: str) -> bool:
     """
     try:
         pyperclip.copy(text)
-        logger.info("Copied to clipboard successfully")
+        logger.debug("Copied to clipboard successfully")
         return True
     except Exception as e:
         logger.error(f"Failed to copy to clipboard: {e}")
@@ -30,4 +31,4 @@ def copy_file_path(filepath: Path) -> bool:
     Returns:
         True if successful, False otherwise
     """
-    return copy_to_clipboard(str(filepath.absolute()))
\ No newline at end of file
+    return copy_to_clipboard(os.path.abspath(os.fspath(filepath)))
\ No newline at end of file
@@ -1,6 +1,6 @@
 from functools import wraps
 from loguru import logger
-import traceback
+import re
 
 def handle_errors(error_callback=None, log_errors=True):
     """
@@ -11,27 +11,39 @@ def handle_errors(error_callback=None, log_errors=True):
         log_errors: Whether to log errors
     """
     def decorator(func):
+        # SystemExit and KeyboardInterrupt are not Exception subclasses,
+        # so critical errors always propagate past these handlers
+        if not log_errors and error_callback is None:
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                try:
+                    return func(*args, **kwargs)
+                except Exception:
+                    return None
+            return wrapper
+            
+        func_name = func.__name__
+        
         @wraps(func)
         def wrapper(*args, **kwargs):
             try:
                 return func(*args, **kwargs)
             except Exception as e:
                 if log_errors:
-                    logger.error(f"Error in {func.__name__}: {str(e)}")
-                    logger.debug(traceback.format_exc())
+                    logger.error(f"Error in {func_name}: {str(e)}")
+                    # Loguru drops the record before formatting the
+                    # traceback when no sink accepts DEBUG
+                    logger.opt(exception=e).debug("Traceback for {}", func_name)
                     
                 if error_callback:
                     error_callback(str(e))
                     
-                # Re-raise if it's a critical error
-                if isinstance(e, (SystemExit, KeyboardInterrupt)):
-                    raise
-                    
                 return None
         return wrapper
     return decorator
 
-# User-friendly error messages mapping
+# User-friendly error messages mapping, highest priority first: when an
+# error mentions several keys, the earliest entry here wins
 ERROR_MESSAGES = {
     "ORA-01017": "Invalid username/password. Please check your credentials.",
     "ORA-12154": "Cannot find database. Please check your database configuration.",
@@ -41,9 +53,14 @@ ERROR_MESSAGES = {
     "No such file": "Configuration file not found. Please check the path.",
 }
 
+# Single alternation over all keys so the error text is scanned once,
+# plus each key's rank for resolving errors that match several keys
+_ERR_RE = re.compile('|'.join(re.escape(key) for key in ERROR_MESSAGES))
+_ERR_RANK = {key: rank for rank, key in enumerate(ERROR_MESSAGES)}
+
 def get_user_friendly_error(technical_error: str) -> str:
     """Convert technical error to user-friendly message."""
-    for key, message in ERROR_MESSAGES.items():
-        if key in technical_error:
-            return message
+    found = _ERR_RE.findall(technical_error)
+    if found:
+        return ERROR_MESSAGES[min(found, key=_ERR_RANK.__getitem__)]
     return "An unexpected error occurred. Please check the logs for details."
\ No newline at end of file
@@ -1,106 +1,239 @@
-from pathlib import Path
 from datetime import datetime
 from typing import Tuple, Optional
+import functools
+import mmap
+import os
 import re
+import stat
+import string
+import time
 
-class Validators:
-    """Common validation functions for the application."""
+# Prefer Google's RE2 (linear-time DFA) for email matching when installed
+try:
+    import re2 as _re_impl
+except ImportError:
+    _re_impl = re
+
+# Pre-compiled validation patterns, shared process-wide
+_EMAIL_PATTERN = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
+_SID_RE = re.compile(r'[A-Za-z0-9]{5,10}\Z', re.ASCII)
+_EMAIL_RE = _re_impl.compile(_EMAIL_PATTERN)
+_EMAIL_LINE_RE = _re_impl.compile(rf'(?m)^{_EMAIL_PATTERN}$')
+
+# Deletes every character the email pattern allows; anything left is invalid
+_EMAIL_ALLOWED = str.maketrans('', '', string.ascii_letters + string.digits + '._%+-@')
+
+# Shared result for every successful validation
+_OK: Tuple[bool, Optional[str]] = (True, None)
+
+# Format used for "Last Time Event Reported" throughout the application
+_DEFAULT_DATETIME_FORMAT = "%Y-%m-%d %H:%M"
+
+# Only the head of a krb5.conf is scanned; real configs are far smaller
+_KRB5_MAX_BYTES = 64 * 1024
+
+# Filesystem checks are cached for this many seconds so repeated GUI
+# validation of the same field does not re-stat the path every time
+_FS_CACHE_TTL = 2
+
+
+def _fs_bucket() -> int:
+    """Return the current TTL bucket; a new bucket forces a cache miss."""
+    return int(time.monotonic() // _FS_CACHE_TTL)
+
+
+@functools.lru_cache(maxsize=512)
+def _stat(path_str: str, bucket: int) -> Optional[os.stat_result]:
+    """Stat path_str with one os.stat call, returning None if it is missing."""
+    try:
+        return os.stat(path_str)
+    except OSError:
+        return None
+
+
+@functools.lru_cache(maxsize=128)
+def _krb5_has_libdefaults(path_str: str, mtime_ns: int, size: int) -> bool:
+    """
+    Check KRB5 config content, memoized on (path, mtime, size).
     
-    @staticmethod
-    def validate_oracle_client_path(path: str) -> Tuple[bool, Optional[str]]:
-        """Validate Oracle Instant Client directory."""
-        if not path:
-            return False, "Oracle Client Path is required"
-            
-        path_obj = Path(path)
-        if not path_obj.exists():
-            return False, f"Path does not exist: {path}"
-            
-        if not path_obj.is_dir():
-            return False, "Oracle Client Path must be a directory"
-            
-        # Check for expected Oracle client files
-        expected_files = ['oci.dll', 'libclntsh.so', 'libclntsh.dylib']
-        if not any((path_obj / f).exists() for f in expected_files):
-            # Just warn, don't fail - different OS have different files
-            pass
-            
-        return True, None
-        
-    @staticmethod
-    def validate_krb5_config(path: str) -> Tuple[bool, Optional[str]]:
-        """Validate Kerberos configuration file."""
-        if not path:
-            return False, "KRB5 Config Path is required"
-            
-        path_obj = Path(path)
-        if not path_obj.exists():
-            return False, f"File does not exist: {path}"
-            
-        if not path_obj.is_file():
-            return False, "KRB5 Config must be a file"
-            
-        # Optionally check file content
+    Read errors propagate and are not cached, as fixing permissions does
+    not change the mtime.
+    """
+    with open(path_str, 'rb') as f:
         try:
-            with open(path_obj, 'r') as f:
-                content = f.read()
-                if '[libdefaults]' not in content:
-                    return False, "Invalid KRB5 config file (missing [libdefaults])"
-        except Exception:
-            return False, "Cannot read KRB5 config file"
-            
-        return True, None
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return mm.find(b'[libdefaults]', 0, _KRB5_MAX_BYTES) != -1
+        except ValueError:
+            # Empty files cannot be memory-mapped
+            return b'[libdefaults]' in f.read(_KRB5_MAX_BYTES)
+
+
+def _is_valid_email(email: str) -> bool:
+    """
+    Structural equivalent of _EMAIL_RE.fullmatch using C-level str methods.
+    
+    local@host.tld where local uses [A-Za-z0-9._%+-], host uses
+    [A-Za-z0-9.-] and tld is at least two ASCII letters.
+    """
+    at = email.find('@')
+    if at < 1 or email.translate(_EMAIL_ALLOWED):
+        return False
         
-    @staticmethod
-    def validate_krb5_cache(path: str) -> Tuple[bool, Optional[str]]:
-        """Validate Kerberos cache file path."""
-        if not path:
-            return False, "KRB5 Cache Path is required"
-            
-        # Cache file might not exist yet (created by kinit)
-        # Just validate the directory exists
-        path_obj = Path(path)
-        parent_dir = path_obj.parent
+    domain = email[at + 1:]
+    if '@' in domain or '_' in domain or '%' in domain or '+' in domain:
+        return False
         
-        if not parent_dir.exists():
-            return False, f"Directory does not exist: {parent_dir}"
-            
-        return True, None
+    host, _, tld = domain.rpartition('.')
+    return bool(host) and len(tld) >= 2 and tld.isalpha()
+
+
+def validate_oracle_client_path(path: str) -> Tuple[bool, Optional[str]]:
+    """Validate Oracle Instant Client directory."""
+    if not path:
+        return False, "Oracle Client Path is required"
         
-    @staticmethod
-    def validate_sid(sid: str) -> Tuple[bool, Optional[str]]:
-        """Validate user SID format."""
-        if not sid:
-            return False, "User SID is required"
-            
-        # Example: SID should be alphanumeric, 5-10 characters
-        if not re.match(r'^[A-Za-z0-9]{5,10}$', sid):
-            return False, "SID must be 5-10 alphanumeric characters"
-            
-        return True, None
+    path = os.fspath(path)
+    path_str = os.path.abspath(path)
+    st = _stat(path_str, _fs_bucket())
+    if st is None:
+        return False, f"Path does not exist: {path}"
         
-    @staticmethod
-    def validate_datetime(datetime_str: str, format: str = "%Y-%m-%d %H:%M") -> Tuple[bool, Optional[str]]:
-        """Validate datetime string format."""
-        if not datetime_str:
-            return False, "DateTime is required"
-            
+    if not stat.S_ISDIR(st.st_mode):
+        return False, "Oracle Client Path must be a directory"
+        
+    # Expected client files (oci.dll, libclntsh.so, libclntsh.dylib) vary
+    # by OS, so their presence is not checked
+    return _OK
+
+
+def validate_krb5_config(path: str) -> Tuple[bool, Optional[str]]:
+    """Validate Kerberos configuration file."""
+    if not path:
+        return False, "KRB5 Config Path is required"
+        
+    path = os.fspath(path)
+    path_str = os.path.abspath(path)
+    st = _stat(path_str, _fs_bucket())
+    if st is None:
+        return False, f"File does not exist: {path}"
+        
+    if not stat.S_ISREG(st.st_mode):
+        return False, "KRB5 Config must be a file"
+        
+    # Optionally check file content
+    try:
+        if not _krb5_has_libdefaults(path_str, st.st_mtime_ns, st.st_size):
+            return False, "Invalid KRB5 config file (missing [libdefaults])"
+    except Exception:
+        return False, "Cannot read KRB5 config file"
+        
+    return _OK
+
+
+def validate_krb5_cache(path: str) -> Tuple[bool, Optional[str]]:
+    """Validate Kerberos cache file path."""
+    if not path:
+        return False, "KRB5 Cache Path is required"
+        
+    path = os.fspath(path)
+    
+    # Cache file might not exist yet (created by kinit)
+    # Just validate the directory exists
+    parent_dir = os.path.dirname(path) or "."
+    
+    if _stat(os.path.abspath(parent_dir), _fs_bucket()) is None:
+        return False, f"Directory does not exist: {parent_dir}"
+        
+    return _OK
+
+
+def validate_sid(sid: str) -> Tuple[bool, Optional[str]]:
+    """Validate user SID format."""
+    if not sid:
+        return False, "User SID is required"
+        
+    # Example: SID should be alphanumeric, 5-10 characters
+    if not _SID_RE.match(sid):
+        return False, "SID must be 5-10 alphanumeric characters"
+        
+    return _OK
+
+
+def _parse_default_datetime(datetime_str: str) -> datetime:
+    """
+    Parse a canonical "YYYY-MM-DD HH:MM" string without strptime.
+    
+    The shape check limits datetime.fromisoformat (a C parser) to exactly
+    this layout. Raises ValueError for anything else, including forms
+    strptime would still accept (e.g. single-digit fields), so callers
+    can fall back.
+    """
+    s = datetime_str
+    if len(s) != 16 or s[4] != '-' or s[7] != '-' or s[10] != ' ' or s[13] != ':':
+        raise ValueError(f"Not in {_DEFAULT_DATETIME_FORMAT} form: {datetime_str!r}")
+        
+    return datetime.fromisoformat(s)
+
+
+def validate_datetime(datetime_str: str, format: str = _DEFAULT_DATETIME_FORMAT) -> Tuple[bool, Optional[str]]:
+    """Validate datetime string format."""
+    if not datetime_str:
+        return False, "DateTime is required"
+        
+    if format == _DEFAULT_DATETIME_FORMAT:
         try:
-            datetime.strptime(datetime_str, format)
-            return True, None
+            _parse_default_datetime(datetime_str)
+            return _OK
         except ValueError:
-            return False, f"Invalid datetime format. Expected: {format}"
-            
-    @staticmethod
-    def validate_email_list(emails: list) -> Tuple[bool, Optional[str]]:
-        """Validate list of email addresses."""
-        if not emails:
-            return False, "At least one email recipient is required"
+            pass  # Let strptime make the final call
             
-        email_pattern = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+    try:
+        datetime.strptime(datetime_str, format)
+        return _OK
+    except ValueError:
+        return False, f"Invalid datetime format. Expected: {format}"
+
+
+def validate_email_list(emails: list) -> Tuple[bool, Optional[str]]:
+    """Validate list of email addresses."""
+    if not emails:
+        return False, "At least one email recipient is required"
+        
+    stripped = [email.strip() for email in emails]
+    
+    # Validate the whole list in a single regex pass over one buffer; an
+    # address containing a newline would span lines, so count those too
+    buffer = "\n".join(stripped)
+    if (buffer.count("\n") == len(stripped) - 1
+            and len(_EMAIL_LINE_RE.findall(buffer)) == len(stripped)):
+        return _OK
         
-        for email in emails:
-            if not email_pattern.match(email.strip()):
-                return False, f"Invalid email address: {email}"
-                
-        return True, None
\ No newline at end of file
+    # Find the first invalid address to report
+    bad = next((email for email in stripped if not _is_valid_email(email)), None)
+    if bad is not None:
+        return False, f"Invalid email address: {bad}"
+            
+    return _OK
+
+
+def validate_email_list_bulk(emails: list) -> Tuple[bool, Optional[str]]:
+    """
+    Validate a large list of email addresses in a single regex pass.
+    
+    Bulk entry point for callers validating many addresses at once. It
+    shares validate_email_list's implementation, which uses the single
+    pass for lists of every size.
+    """
+    return validate_email_list(emails)
+
+
+class Validators:
+    """Common validation functions for the application."""
+    
+    validate_oracle_client_path = staticmethod(validate_oracle_client_path)
+    validate_krb5_config = staticmethod(validate_krb5_config)
+    validate_krb5_cache = staticmethod(validate_krb5_cache)
+    validate_sid = staticmethod(validate_sid)
+    validate_datetime = staticmethod(validate_datetime)
+    validate_email_list = staticmethod(validate_email_list)
+    validate_email_list_bulk = staticmethod(validate_email_list_bulk)
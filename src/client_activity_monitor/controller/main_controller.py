@@ -29,7 +29,7 @@ from ..common.clipboard_utils import copy_file_path
 from ..model.integrations.email_service import EmailService
 from ..model.integrations.onenote_service import OneNoteService
 from ..view.app_ui import AppUI
-from ..common.validators import Validators
+from ..common.validators import validate_datetime
 from ..common.exceptions import ConfigurationError, DatabaseConnectionError
 from ..common.error_handler import handle_errors, get_user_friendly_error
 
@@ -196,7 +196,7 @@ class MainController:
         """
         try:
             # Validate inputs
-            is_valid, error_msg = Validators.validate_datetime(last_event_time_str)
+            is_valid, error_msg = validate_datetime(last_event_time_str)
             if not is_valid:
                 self.show_error("Invalid Input", error_msg)
                 return
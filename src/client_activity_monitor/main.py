@@ -32,6 +32,15 @@ sys.path.insert(0, str(project_root))
 def main():
     """Main entry point for the Client Activity Monitor application."""
     try:
+        # Write log records from a background thread so logging never
+        # blocks the UI thread; diagnose=False keeps local variable
+        # values (credentials, query params) out of logged tracebacks
+        from loguru import logger
+        logger.remove()
+        # sys.stderr is None under pythonw or a windowed (frozen) launch
+        if sys.stderr:
+            logger.add(sys.stderr, enqueue=True, diagnose=False)
+        
         # Import here to ensure path is set up
         from client_activity_monitor.controller.main_controller import MainController
         
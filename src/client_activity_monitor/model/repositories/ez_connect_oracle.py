@@ -535,6 +535,39 @@ class OracleKerberosConnection:
                 return [dict(zip(columns, row)) for row in cursor.fetchall()]
             return []
 
+    def execute_query_columnar(
+        self, sql: str, params: Optional[Dict[str, Any]] = None
+    ) -> Tuple[List[str], List[Tuple[Any, ...]]]:
+        """
+        Execute a query and return results column by column.
+
+        Avoids building one dictionary per row when the caller only needs
+        the values of each column, e.g. to construct a DataFrame.
+
+        Args:
+            sql: SQL query to execute
+            params: Parameters for the query (optional)
+
+        Returns:
+            Tuple of (column names, one tuple of values per column)
+
+        Raises:
+            ValueError: If no active connection
+            oracledb.DatabaseError: If query execution fails
+        """
+        if not self.connection:
+            raise ValueError("No active connection. Connect first.")
+
+        with self.connection.cursor() as cursor:
+            cursor.execute(sql, params or {})
+            if not cursor.description:
+                return [], []
+            columns = [col[0] for col in cursor.description]
+            rows = cursor.fetchall()
+            if not rows:
+                return columns, [() for _ in columns]
+            return columns, list(zip(*rows))
+
     def execute_many(self, sql: str, params: List[Dict[str, Any]]) -> int:
         """
         Execute a batch operation with multiple parameter sets.
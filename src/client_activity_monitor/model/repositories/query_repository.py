@@ -1,3 +1,4 @@
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 import pandas as pd
@@ -6,6 +7,12 @@ from loguru import logger
 from .ez_connect_oracle import OracleKerberosConnection
 from ...common.exceptions import DatabaseConnectionError
 
+@lru_cache(maxsize=64)
+def _load_sql(path_str: str, mtime_ns: int) -> str:
+    """Read a SQL file, memoized on (path, mtime) so edits are picked up."""
+    with open(path_str, 'r') as f:
+        return f.read()
+
 class QueryRepository:
     """Handles query execution for a single Oracle database."""
     
@@ -63,21 +70,27 @@ class QueryRepository:
             return pd.DataFrame()
             
         try:
-            # Read SQL from file
+            # Read SQL from file, reusing the cached text while it is unchanged
             sql_path = Path(sql_file_path)
-            if not sql_path.exists():
+            try:
+                mtime_ns = sql_path.stat().st_mtime_ns
+            except FileNotFoundError:
                 logger.error(f"SQL file not found: {sql_file_path}")
                 return pd.DataFrame()
                 
-            with open(sql_path, 'r') as f:
-                sql = f.read()
+            sql = _load_sql(str(sql_path), mtime_ns)
                 
             # Execute query with parameter
             params = {'start_date': start_date}
             logger.info(f"Executing {query_name} on {self.database_name}")
             
-            results = self.connection.execute_query(sql, params)
-            df = pd.DataFrame(results)
+            # Build the frame column by column rather than from per-row dicts
+            columns, values = self.connection.execute_query_columnar(sql, params)
+            if values and values[0]:
+                df = pd.DataFrame(dict(zip(columns, values)), copy=False)
+            else:
+                # No rows: an empty frame without columns, as before
+                df = pd.DataFrame()
             
             logger.info(f"Query {query_name} returned {len(df)} rows from {self.database_name}")
             return df
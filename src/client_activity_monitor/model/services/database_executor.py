@@ -1,5 +1,5 @@
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from threading import Event
+from threading import Event, Lock
 from typing import Dict, Callable, Any, Optional, List
 import pandas as pd
 from datetime import datetime
@@ -154,7 +154,7 @@ class DatabaseExecutor:
         cancel_event: Event
     ) -> Dict[str, pd.DataFrame]:
         """
-        Execute all queries for a single database.
+        Execute all queries for a single database concurrently.
         
         Returns:
             Dictionary mapping query names to DataFrames
@@ -172,44 +172,128 @@ class DatabaseExecutor:
             progress_callback(db_name, "all", "failed", None)
             return results
             
+        query_defs = list(db_config.sql_queries)
+        
+        # Once one query fails the database is marked failed, and the other
+        # queries stop starting new work and stop reporting progress
+        db_failed = Event()
+        status_lock = Lock()
+        
+        def report_query_progress(database_name, query_name, status, row_count):
+            with status_lock:
+                if not db_failed.is_set():
+                    progress_callback(database_name, query_name, status, row_count)
+                    
+        # Queries are I/O-bound Oracle round-trips, so run them
+        # concurrently. Each query gets its own connection because
+        # oracledb serializes calls made on a shared one.
+        query_results = {}
+        with ThreadPoolExecutor(max_workers=max(1, len(query_defs))) as executor:
+            future_to_query = {
+                executor.submit(
+                    self._execute_query,
+                    conn_params,
+                    db_name,
+                    query_def,
+                    start_date,
+                    report_query_progress,
+                    cancel_event,
+                    db_failed
+                ): query_def
+                for query_def in query_defs
+            }
+            
+            # Collect every query, keeping the results of those that succeed
+            for future in as_completed(future_to_query):
+                query_def = future_to_query[future]
+                try:
+                    df = future.result()
+                except Exception as e:
+                    logger.error(f"Error executing {query_def.name} on {db_name}: {e}")
+                    if not db_failed.is_set():
+                        with status_lock:
+                            db_failed.set()
+                        progress_callback(db_name, "all", "failed", None)
+                    continue
+                    
+                if df is not None:
+                    query_results[query_def.name] = df
+                    
+        # Store results in query definition order
+        for query_def in query_defs:
+            if query_def.name in query_results:
+                results[query_def.name] = query_results[query_def.name]
+                
+        return results
+        
+    def _execute_query(
+        self,
+        conn_params: Dict[str, Any],
+        db_name: str,
+        query_def: Any,  # SqlQuery from config_manager
+        start_date: datetime,
+        progress_callback: Callable,
+        cancel_event: Event,
+        db_failed: Event
+    ) -> Optional[pd.DataFrame]:
+        """
+        Execute a single query on its own database connection.
+        
+        Cancellation and failure of another query on the same database are
+        checked before connecting and again before the query is executed,
+        as the Kerberos connect is the slow step.
+        
+        Returns:
+            DataFrame with the query results, or None if it did not run
+        """
+        if self._query_stopped(db_name, query_def, progress_callback, cancel_event, db_failed):
+            return None
+            
         # Create repository instance
         repo = QueryRepository(conn_params, db_name)
         
         try:
             # Connect to database
             if not repo.connect():
-                progress_callback(db_name, "all", "failed", None)
                 raise DatabaseConnectionError(f"Failed to connect to database: {db_name}")
                 
-            # Execute each query defined for this database
-            for query_def in db_config.sql_queries:
-                if cancel_event.is_set():
-                    progress_callback(db_name, query_def.name, "cancelled", None)
-                    logger.info(f"Cancelled query {query_def.name} on {db_name}")
-                    break
-                    
-                # Update progress: running query
-                progress_callback(db_name, query_def.name, "running", None)
-                
-                # Execute query
-                df = repo.execute_query(
-                    query_name=query_def.name,
-                    sql_file_path=query_def.query_location,
-                    start_date=start_date
-                )
-                
-                # Store result
-                results[query_def.name] = df
+            if self._query_stopped(db_name, query_def, progress_callback, cancel_event, db_failed):
+                return None
                 
-                # Update progress: completed
-                row_count = len(df) if not df.empty else 0
-                progress_callback(db_name, query_def.name, "completed", row_count)
-                
-        except Exception as e:
-            logger.error(f"Error executing queries on {db_name}: {e}")
-            progress_callback(db_name, "all", "failed", None)
+            # Update progress: running query
+            progress_callback(db_name, query_def.name, "running", None)
+            
+            # Execute query
+            df = repo.execute_query(
+                query_name=query_def.name,
+                sql_file_path=query_def.query_location,
+                start_date=start_date
+            )
+            
+            # Update progress: completed
+            row_count = len(df) if not df.empty else 0
+            progress_callback(db_name, query_def.name, "completed", row_count)
+            return df
+            
         finally:
             # Always close connection
             repo.close()
             
-        return results
\ No newline at end of file
+    def _query_stopped(
+        self,
+        db_name: str,
+        query_def: Any,
+        progress_callback: Callable,
+        cancel_event: Event,
+        db_failed: Event
+    ) -> bool:
+        """Return True if the query should not run, reporting a cancellation."""
+        if db_failed.is_set():
+            return True
+            
+        if cancel_event.is_set():
+            progress_callback(db_name, query_def.name, "cancelled", None)
+            logger.info(f"Cancelled query {query_def.name} on {db_name}")
+            return True
+            
+        return False
\ No newline at end of file
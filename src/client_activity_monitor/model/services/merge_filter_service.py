@@ -1,12 +1,21 @@
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from functools import reduce
+from typing import Dict, List, Optional, Set, Tuple
 from loguru import logger
 
+# pandas 2.x copies every column in rename/concat unless told not to;
+# pandas 3 defers copies with copy-on-write and deprecates the keyword
+_NO_COPY = {'copy': False} if int(pd.__version__.split('.')[0]) < 3 else {}
+
 class MergeFilterService:
     """
     Service to merge and filter query results from multiple databases.
     Identifies users who made all 4 change types within 24 hours.
+    
+    The service holds no per-instance state, so a single instance can be
+    shared between callers.
     """
     
     # Define the expected query names and their change types
@@ -17,10 +26,20 @@ class MergeFilterService:
         "Get token changes": "token"
     }
     
-    def __init__(self):
-        """Initialize the merge filter service."""
-        self.required_change_types = {"password", "email", "phone", "token"}
-        
+    # Change types a user must have made, in report column order
+    REQUIRED_CHANGE_TYPES = ("password", "email", "phone", "token")
+    CHANGE_TYPE_DTYPE = pd.CategoricalDtype(REQUIRED_CHANGE_TYPES)
+    
+    # Optional columns copied into the report for each change type
+    EXTRA_REPORT_FIELDS = ('changed_by', 'old_value', 'new_value')
+    
+    # Accepted (lowercase) source column names for each standard column
+    COLUMN_ALIASES = {
+        'user_id': frozenset({'user_id', 'userid', 'user', 'employee_id'}),
+        'change_timestamp': frozenset({'change_timestamp', 'change_time', 'timestamp',
+                                       'modified_date', 'change_date', 'action_timestamp'})
+    }
+    
     def process_results(
         self,
         database_results: Dict[str, Dict[str, pd.DataFrame]],
@@ -48,40 +67,46 @@ class MergeFilterService:
             Columns: user_id, password_change_time, email_change_time, 
                     phone_change_time, token_change_time, [other relevant fields]
         """
-        # Step 1: Combine all results into a single structure by change type
-        combined_changes = self._combine_results_by_change_type(database_results)
+        # Nothing to merge when every query came back empty
+        if all(df.empty for queries in database_results.values() for df in queries.values()):
+            logger.info("All query results are empty; no users meet the criteria")
+            return pd.DataFrame()
+            
+        # Step 1: Combine all results into one frame labelled by change type,
+        # keeping only changes within 24 hours of last_event_time
+        window_changes, report_fields = self._combine_results(database_results, last_event_time)
         
-        # Step 2: Find users with all 4 change types
-        users_with_all_changes = self._find_users_with_all_changes(combined_changes)
+        # Step 2: Keep only users with all 4 change types in the window
+        qualifying_changes = self._find_users_with_all_changes(window_changes)
         
-        # Step 3: Filter to only changes within 24 hours of last_event_time
-        filtered_users = self._filter_by_time_window(
-            users_with_all_changes,
-            last_event_time
-        )
+        # Step 3: Keep the latest change per user and change type
+        latest_changes = self._latest_changes(qualifying_changes)
         
         # Step 4: Create final report DataFrame
-        report_df = self._create_report_dataframe(filtered_users)
+        report_df = self._create_report_dataframe(latest_changes, report_fields)
         
         logger.info(f"Found {len(report_df)} users meeting all criteria")
         return report_df
         
-    def _combine_results_by_change_type(
+    def _combine_results(
         self,
-        database_results: Dict[str, Dict[str, pd.DataFrame]]
-    ) -> Dict[str, pd.DataFrame]:
+        database_results: Dict[str, Dict[str, pd.DataFrame]],
+        last_event_time: datetime
+    ) -> Tuple[pd.DataFrame, Dict[str, Set[str]]]:
         """
-        Combine results from all databases organized by change type.
+        Combine results from all databases into a single DataFrame.
+        
+        Each frame is cut to the 24-hour window before concatenation, while
+        it still has the row order its query returned.
         
         Returns:
-            {
-                "password": DataFrame with all password changes,
-                "email": DataFrame with all email changes,
-                "phone": DataFrame with all phone changes,
-                "token": DataFrame with all token changes
-            }
+            Tuple of:
+            - DataFrame with one row per change in the window and at least the
+              columns user_id, change_timestamp, change_type and source_database
+            - The EXTRA_REPORT_FIELDS returned by each change type's queries
         """
-        combined = {change_type: pd.DataFrame() for change_type in self.required_change_types}
+        frames = []
+        report_fields = {change_type: set() for change_type in self.REQUIRED_CHANGE_TYPES}
         
         for db_name, queries in database_results.items():
             for query_name, df in queries.items():
@@ -94,44 +119,64 @@ class MergeFilterService:
                     logger.warning(f"Unknown query name: {query_name}")
                     continue
                     
-                # Add source database column for tracking
-                df = df.copy()
-                df['source_database'] = db_name
-                
                 # Standardize column names if needed
                 df = self._standardize_columns(df, change_type)
-                
-                # Combine with existing data for this change type
-                if combined[change_type].empty:
-                    combined[change_type] = df
-                else:
-                    combined[change_type] = pd.concat(
-                        [combined[change_type], df],
-                        ignore_index=True
-                    )
+                if 'user_id' not in df.columns or 'change_timestamp' not in df.columns:
+                    continue
                     
+                # Add source database column for tracking
+                df['source_database'] = db_name
+                    
+                report_fields[change_type].update(
+                    col for col in self.EXTRA_REPORT_FIELDS if col in df.columns
+                )
+                frames.append(df)
                 logger.info(f"Added {len(df)} {change_type} changes from {db_name}")
                 
-        return combined
+        if not frames:
+            return pd.DataFrame(
+                columns=['user_id', 'change_timestamp', 'change_type', 'source_database']
+            ), report_fields
+            
+        # Shared categorical user_id so grouping and pivoting hash integer
+        # codes instead of Python strings
+        user_ids = pd.Index(
+            np.concatenate([df['user_id'].unique() for df in frames])
+        ).unique().dropna()
+        try:
+            user_ids = user_ids.sort_values()
+        except TypeError:
+            # Databases disagree on the id type (e.g. NUMBER and VARCHAR2);
+            # such ids never match and cannot be ordered, so keep them unsorted
+            logger.warning("User ids of mixed types; report rows will not be sorted by user_id")
+        user_dtype = pd.CategoricalDtype(categories=user_ids)
+        for df in frames:
+            df['user_id'] = df['user_id'].astype(user_dtype)
+            
+        # One concatenation for all change types and databases
+        window_changes = pd.concat(
+            [self._filter_by_time_window(df, last_event_time) for df in frames],
+            ignore_index=True,
+            **_NO_COPY
+        )
+        return window_changes, report_fields
         
     def _standardize_columns(self, df: pd.DataFrame, change_type: str) -> pd.DataFrame:
         """
         Standardize column names across different queries.
         Ensure each DataFrame has at minimum: user_id, change_timestamp
-        """
-        # Map possible column names to standard names
-        column_mappings = {
-            'user_id': ['user_id', 'userid', 'user', 'employee_id'],
-            'change_timestamp': ['change_timestamp', 'change_time', 'timestamp', 
-                               'modified_date', 'change_date', 'action_timestamp']
-        }
         
-        # Rename columns to standard names
-        for standard_name, possible_names in column_mappings.items():
+        Returns a new DataFrame; the input DataFrame is not modified.
+        """
+        # Rename columns to standard names in a single rename, which also
+        # gives the new DataFrame that later column assignments go to
+        renames = {}
+        for standard_name, possible_names in self.COLUMN_ALIASES.items():
             for col in df.columns:
-                if col.lower() in [name.lower() for name in possible_names]:
-                    df = df.rename(columns={col: standard_name})
+                if col.lower() in possible_names:
+                    renames[col] = standard_name
                     break
+        df = df.rename(columns=renames, **_NO_COPY)
                     
         # Verify required columns exist
         required_columns = ['user_id', 'change_timestamp']
@@ -144,135 +189,171 @@ class MergeFilterService:
         if 'change_timestamp' in df.columns:
             df['change_timestamp'] = pd.to_datetime(df['change_timestamp'])
             
-        # Add change type column
-        df['change_type'] = change_type
+        # Add change type column, filled directly with its categorical code
+        df['change_type'] = pd.Categorical.from_codes(
+            np.full(len(df), self.REQUIRED_CHANGE_TYPES.index(change_type)),
+            dtype=self.CHANGE_TYPE_DTYPE
+        )
         
         return df
         
-    def _find_users_with_all_changes(
+    def _filter_by_time_window(
         self,
-        combined_changes: Dict[str, pd.DataFrame]
-    ) -> Dict[str, Dict[str, pd.DataFrame]]:
+        changes: pd.DataFrame,
+        last_event_time: datetime
+    ) -> pd.DataFrame:
         """
-        Find users who appear in all 4 change types.
+        Filter to only changes that occurred within 24 hours before the
+        last_event_time.
         
-        Returns:
-            {
-                "user123": {
-                    "password": DataFrame of password changes for user123,
-                    "email": DataFrame of email changes for user123,
-                    "phone": DataFrame of phone changes for user123,
-                    "token": DataFrame of token changes for user123
-                }
-            }
+        The queries return rows ordered by change time, so the window is
+        usually one contiguous run of rows found by binary search; other
+        orderings fall back to a boolean mask.
         """
-        # Get unique users from each change type
-        users_by_type = {}
-        for change_type, df in combined_changes.items():
-            if not df.empty and 'user_id' in df.columns:
-                users_by_type[change_type] = set(df['user_id'].unique())
-            else:
-                users_by_type[change_type] = set()
-                
-        # Find intersection - users with all 4 change types
-        if len(users_by_type) < 4:
-            logger.warning(f"Only found {len(users_by_type)} change types with data")
-            return {}
+        if changes.empty:
+            return changes
             
-        users_with_all = set.intersection(*users_by_type.values())
-        logger.info(f"Found {len(users_with_all)} users with all 4 change types")
+        window_start = np.datetime64(last_event_time - timedelta(hours=24))
+        window_end = np.datetime64(last_event_time)
+        timestamps = changes['change_timestamp']
         
-        # Build result structure
-        result = {}
-        for user_id in users_with_all:
-            result[user_id] = {}
-            for change_type, df in combined_changes.items():
-                if not df.empty:
-                    user_changes = df[df['user_id'] == user_id].copy()
-                    result[user_id][change_type] = user_changes
-                    
-        return result
+        if timestamps.is_monotonic_increasing:
+            values = timestamps.to_numpy()
+            first = np.searchsorted(values, window_start, side='left')
+            stop = np.searchsorted(values, window_end, side='right')
+            return changes.iloc[first:stop]
+            
+        if timestamps.is_monotonic_decreasing:
+            # Search the ascending view of the newest-first rows
+            values = timestamps.to_numpy()[::-1]
+            first = len(values) - np.searchsorted(values, window_end, side='right')
+            stop = len(values) - np.searchsorted(values, window_start, side='left')
+            return changes.iloc[first:stop]
+            
+        # One boolean mask over the raw datetime64 buffer of all changes
+        values = timestamps.to_numpy()
+        mask = (values >= window_start) & (values <= window_end)
+        return changes.iloc[mask]
         
-    def _filter_by_time_window(
-        self,
-        users_with_all_changes: Dict[str, Dict[str, pd.DataFrame]],
-        last_event_time: datetime
-    ) -> Dict[str, Dict[str, pd.DataFrame]]:
+    def _find_users_with_all_changes(self, window_changes: pd.DataFrame) -> pd.DataFrame:
         """
-        Filter to only users where ALL changes occurred within 24 hours 
-        before the last_event_time.
+        Keep only the changes of users who appear in all 4 change types.
+        
+        Intersecting the user ids first means the grouping and lookups
+        that follow only see rows of qualifying users.
+        """
+        if window_changes.empty:
+            return window_changes
+            
+        # Get unique users from each change type, as categorical codes;
+        # rows without a user_id have code -1 and never qualify
+        user_codes = window_changes['user_id'].cat.codes
+        known_users = user_codes[user_codes >= 0]
+        users_by_type = known_users.groupby(
+            window_changes['change_type'], sort=False, observed=True
+        ).unique()
+        if not all(change_type in users_by_type.index for change_type in self.REQUIRED_CHANGE_TYPES):
+            logger.warning(f"Only found {len(users_by_type)} change types with data")
+            return window_changes.iloc[:0]
+            
+        # Find intersection - users with all 4 change types
+        users_with_all = reduce(
+            pd.Index.intersection,
+            (pd.Index(users_by_type[change_type]) for change_type in self.REQUIRED_CHANGE_TYPES)
+        )
+        logger.info(f"{len(users_with_all)} users had all changes within 24-hour window")
+        
+        return window_changes.iloc[user_codes.isin(users_with_all).to_numpy()]
+        
+    def _latest_changes(self, window_changes: pd.DataFrame) -> pd.DataFrame:
         """
-        window_start = last_event_time - timedelta(hours=24)
-        filtered_users = {}
+        Select the most recent change of each type for every user.
         
-        for user_id, changes_by_type in users_with_all_changes.items():
-            # Check if all change types have at least one change in the window
-            all_in_window = True
-            user_filtered_changes = {}
+        Returns:
+            DataFrame with one row per user_id and change_type pair
+        """
+        if window_changes.empty:
+            return window_changes
             
-            for change_type, df in changes_by_type.items():
-                # Filter to changes within the 24-hour window
-                mask = (df['change_timestamp'] >= window_start) & \
-                       (df['change_timestamp'] <= last_event_time)
-                filtered_df = df[mask]
-                
-                if filtered_df.empty:
-                    all_in_window = False
-                    break
-                    
-                user_filtered_changes[change_type] = filtered_df
-                
-            if all_in_window:
-                filtered_users[user_id] = user_filtered_changes
-                
-        logger.info(f"{len(filtered_users)} users had all changes within 24-hour window")
-        return filtered_users
+        latest_rows = (
+            window_changes
+            .groupby(['user_id', 'change_type'], sort=False, observed=True)['change_timestamp']
+            .idxmax()
+        )
+        return window_changes.loc[latest_rows.values]
         
     def _create_report_dataframe(
         self,
-        filtered_users: Dict[str, Dict[str, pd.DataFrame]]
+        latest_changes: pd.DataFrame,
+        report_fields: Dict[str, Set[str]]
     ) -> pd.DataFrame:
         """
         Create final report DataFrame with one row per qualifying user.
+        
+        Args:
+            latest_changes: Latest change per user and change type
+            report_fields: Extra fields each change type's queries returned
         """
-        if not filtered_users:
+        latest_by_type = dict(tuple(latest_changes.groupby('change_type', sort=False, observed=True)))
+        if not latest_by_type:
             return pd.DataFrame()
             
-        report_rows = []
+        # Build the user lookup once from the first change type's users and
+        # probe it with every change type. All frames share one categorical
+        # user_id dtype, so both sides are plain integer codes. Categories
+        # are sorted where the ids allow it, so sorted codes put the rows
+        # in user_id order
+        anchor = latest_by_type[self.REQUIRED_CHANGE_TYPES[0]]['user_id']
+        anchor_codes = pd.Index(np.sort(anchor.cat.codes.to_numpy()))
+        size = len(anchor_codes)
+        
+        # Collect every column first and build the frame once at the end
+        report_columns = {'user_id': anchor.cat.categories.take(anchor_codes)}
         
-        for user_id, changes_by_type in filtered_users.items():
-            row = {'user_id': user_id}
+        for change_type in self.REQUIRED_CHANGE_TYPES:
+            changes = latest_by_type[change_type]
+            positions = anchor_codes.get_indexer(changes['user_id'].cat.codes.to_numpy())
             
-            # Get the most recent change for each type
-            for change_type in self.required_change_types:
-                if change_type in changes_by_type and not changes_by_type[change_type].empty:
-                    df = changes_by_type[change_type]
-                    latest = df.loc[df['change_timestamp'].idxmax()]
-                    
-                    row[f'{change_type}_change_time'] = latest['change_timestamp']
-                    row[f'{change_type}_source_db'] = latest.get('source_database', 'Unknown')
-                    
-                    # Include any additional relevant fields
-                    for col in ['changed_by', 'old_value', 'new_value']:
-                        if col in latest:
-                            row[f'{change_type}_{col}'] = latest[col]
-                            
-            report_rows.append(row)
+            report_columns[f'{change_type}_change_time'] = self._scatter(
+                changes['change_timestamp'], positions, size
+            )
+            report_columns[f'{change_type}_source_db'] = self._scatter(
+                changes['source_database'], positions, size
+            )
             
-        report_df = pd.DataFrame(report_rows)
+            # Include any additional relevant fields its queries returned
+            for col in self.EXTRA_REPORT_FIELDS:
+                if col in report_fields[change_type]:
+                    report_columns[f'{change_type}_{col}'] = self._scatter(changes[col], positions, size)
+                    
+        # Add summary columns
+        # Calculate earliest and latest change for each user
+        change_times = [
+            report_columns[f'{change_type}_change_time']
+            for change_type in self.REQUIRED_CHANGE_TYPES
+        ]
+        earliest = np.fmin.reduce(change_times)
+        latest = np.fmax.reduce(change_times)
+        report_columns['earliest_change'] = earliest
+        report_columns['latest_change'] = latest
+        report_columns['change_window_hours'] = (latest - earliest) / np.timedelta64(1, 'h')
         
-        # Sort by user_id
-        report_df = report_df.sort_values('user_id')
+        return pd.DataFrame(report_columns, copy=False)
         
-        # Add summary columns
-        if not report_df.empty:
-            # Calculate earliest and latest change for each user
-            change_time_cols = [col for col in report_df.columns if col.endswith('_change_time')]
-            report_df['earliest_change'] = report_df[change_time_cols].min(axis=1)
-            report_df['latest_change'] = report_df[change_time_cols].max(axis=1)
-            report_df['change_window_hours'] = (
-                (report_df['latest_change'] - report_df['earliest_change'])
-                .dt.total_seconds() / 3600
-            )
+    @staticmethod
+    def _scatter(values: pd.Series, positions: np.ndarray, size: int) -> np.ndarray:
+        """
+        Place values at their positions in an array of length size.
+        
+        Negative positions (values with no slot) are dropped; slots that
+        receive no value are left missing.
+        """
+        values = values.to_numpy()
+        if values.dtype.kind == 'M':
+            result = np.full(size, np.datetime64('NaT'), dtype=values.dtype)
+        else:
+            result = np.full(size, np.nan, dtype=object)
             
-        return report_df
\ No newline at end of file
+        found = positions >= 0
+        result[positions[found]] = values[found]
+        return result
\ No newline at end of file
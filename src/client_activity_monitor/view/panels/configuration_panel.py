@@ -7,9 +7,14 @@ settings, Kerberos paths, and user SID.
 
 import customtkinter as ctk
 from tkinter import filedialog, messagebox
-from typing import Callable, Dict, Optional
+from typing import Callable, Dict
 from pathlib import Path
-from ...common.validators import Validators
+from ...common.validators import (
+    validate_oracle_client_path,
+    validate_krb5_config,
+    validate_krb5_cache,
+    validate_sid
+)
 
 
 class ConfigurationPanel(ctk.CTkFrame):
@@ -143,10 +148,10 @@ class ConfigurationPanel(ctk.CTkFrame):
             
             # Validate each field
             validators = [
-                (Validators.validate_oracle_client_path(oracle_path), "Oracle Client Path"),
-                (Validators.validate_krb5_config(krb5_config), "KRB5 Config"),
-                (Validators.validate_krb5_cache(krb5_cache), "KRB5 Cache"),
-                (Validators.validate_sid(sid), "User SID")
+                (validate_oracle_client_path(oracle_path), "Oracle Client Path"),
+                (validate_krb5_config(krb5_config), "KRB5 Config"),
+                (validate_krb5_cache(krb5_cache), "KRB5 Cache"),
+                (validate_sid(sid), "User SID")
             ]
             
             # Check all validations
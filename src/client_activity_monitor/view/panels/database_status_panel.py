@@ -1,11 +1,23 @@
 import customtkinter as ctk
 from typing import Dict, Optional
-from datetime import datetime
-from loguru import logger
+
+# Label colors for each status reported by DatabaseExecutor
+_STATUS_COLORS = {
+    "connecting": "orange",
+    "running": "blue",
+    "completed": "green",
+    "failed": "red",
+    "cancelled": "gray",
+    "idle": "gray"
+}
+_STATUS_TITLES = {status: status.title() for status in _STATUS_COLORS}
 
 class DatabaseStatusPanel(ctk.CTkFrame):
     """
     Displays status for each database and its queries during execution.
+    
+    Note: never call self.update() here; it re-enters the event loop.
+    Use update_idletasks() when pending layout must be flushed.
     """
     
     def __init__(self, parent):
@@ -13,6 +25,9 @@ class DatabaseStatusPanel(ctk.CTkFrame):
         super().__init__(parent)
         self.database_widgets = {}
         self.query_widgets = {}
+        self._db_status: Dict[str, str] = {}
+        self._overall_update_pending = False
+        self._spacer_row: Optional[int] = None
         self._create_widgets()
         
     def _create_widgets(self):
@@ -24,6 +39,7 @@ class DatabaseStatusPanel(ctk.CTkFrame):
         # Overall status
         self.overall_status_label = ctk.CTkLabel(self, text="Overall Status: Idle")
         self.overall_status_label.grid(row=1, column=0, columnspan=2, pady=5)
+        self._last_overall = ("Overall Status: Idle", None)
         
         # Placeholder for dynamic database status
         self.status_frame = ctk.CTkFrame(self)
@@ -40,61 +56,95 @@ class DatabaseStatusPanel(ctk.CTkFrame):
         Args:
             database_configs: List of database configurations from ConfigManager
         """
-        # Clear existing widgets
-        for widget in self.status_frame.winfo_children():
-            widget.destroy()
-        self.database_widgets.clear()
-        self.query_widgets.clear()
+        # Take the frame out of the layout while it is rebuilt so the
+        # geometry manager runs once instead of once per label
+        self.status_frame.grid_remove()
+        
+        # Existing widgets are reused for databases/queries that are still
+        # configured; whatever is left over afterwards is destroyed
+        old_database_widgets = self.database_widgets
+        old_query_widgets = self.query_widgets
+        self.database_widgets = {}
+        self.query_widgets = {}
+        self._db_status.clear()
+        
+        # (widget, grid options) pairs, applied in one pass below
+        placements = []
         
         row = 0
         for db_config in database_configs:
             # Database name and status
-            db_label = ctk.CTkLabel(
-                self.status_frame,
-                text=f"Database: {db_config.name}",
-                font=("Arial", 12, "bold")
-            )
-            db_label.grid(row=row, column=0, sticky="w", pady=(10, 5))
-            
-            db_status = ctk.CTkLabel(
-                self.status_frame,
-                text="Status: Not Connected",
-                text_color="gray"
-            )
-            db_status.grid(row=row, column=1, sticky="e", pady=(10, 5))
-            
-            self.database_widgets[db_config.name] = {
-                'label': db_label,
-                'status': db_status
-            }
+            db_entry = old_database_widgets.pop(db_config.name, None)
+            if db_entry is None:
+                db_entry = {
+                    'label': ctk.CTkLabel(
+                        self.status_frame,
+                        text=f"Database: {db_config.name}",
+                        font=("Arial", 12, "bold")
+                    ),
+                    'status': ctk.CTkLabel(
+                        self.status_frame,
+                        text="Status: Not Connected",
+                        text_color="gray"
+                    ),
+                    'last': ("Status: Not Connected", "gray")
+                }
+            else:
+                self._set_status(db_entry, "Status: Not Connected", "gray")
+                
+            db_entry['row'] = row
+            placements.append((db_entry['label'], dict(row=row, column=0, sticky="w", pady=(10, 5))))
+            placements.append((db_entry['status'], dict(row=row, column=1, sticky="e", pady=(10, 5))))
+            self.database_widgets[db_config.name] = db_entry
+            self._db_status[db_config.name] = "not connected"
             row += 1
             
             # Query status for each query in this database
             for query_def in db_config.sql_queries:
-                query_label = ctk.CTkLabel(
-                    self.status_frame,
-                    text=f"  • {query_def.name}:",
-                    font=("Arial", 10)
-                )
-                query_label.grid(row=row, column=0, sticky="w", padx=(20, 0))
-                
-                query_status = ctk.CTkLabel(
-                    self.status_frame,
-                    text="Pending",
-                    text_color="gray"
-                )
-                query_status.grid(row=row, column=1, sticky="e")
-                
                 # Store reference with database name and query name
                 key = f"{db_config.name}:{query_def.name}"
-                self.query_widgets[key] = {
-                    'label': query_label,
-                    'status': query_status
-                }
+                query_entry = old_query_widgets.pop(key, None)
+                if query_entry is None:
+                    query_entry = {
+                        'label': ctk.CTkLabel(
+                            self.status_frame,
+                            text=f"  • {query_def.name}:",
+                            font=("Arial", 10)
+                        ),
+                        'status': ctk.CTkLabel(
+                            self.status_frame,
+                            text="Pending",
+                            text_color="gray"
+                        ),
+                        'last': ("Pending", "gray")
+                    }
+                else:
+                    self._set_status(query_entry, "Pending", "gray")
+                    
+                query_entry['row'] = row
+                placements.append((query_entry['label'], dict(row=row, column=0, sticky="w", padx=(20, 0))))
+                placements.append((query_entry['status'], dict(row=row, column=1, sticky="e")))
+                self.query_widgets[key] = query_entry
                 row += 1
                 
-        # Add spacing at bottom
+        # Destroy widgets for databases/queries no longer configured
+        for entry in (*old_database_widgets.values(), *old_query_widgets.values()):
+            entry['label'].destroy()
+            entry['status'].destroy()
+            
+        for widget, options in placements:
+            widget.grid(**options)
+            
+        # Add spacing at bottom, moving it if the row count changed
+        if self._spacer_row is not None and self._spacer_row != row:
+            self.status_frame.grid_rowconfigure(self._spacer_row, weight=0)
         self.status_frame.grid_rowconfigure(row, weight=1)
+        self._spacer_row = row
+        
+        # Restore the frame with its original grid options and flush the
+        # pending geometry/redraw work in one pass
+        self.status_frame.grid()
+        self.update_idletasks()
         
     def update_database_status(
         self,
@@ -115,57 +165,61 @@ class DatabaseStatusPanel(ctk.CTkFrame):
         if query_name == "all":
             # Database-level status update
             if database_name in self.database_widgets:
-                status_widget = self.database_widgets[database_name]['status']
-                self._update_status_widget(status_widget, status, True)
+                widget_entry = self.database_widgets[database_name]
+                self._db_status[database_name] = status
+                self._update_status_widget(widget_entry, status, True)
                 
-                # Update overall status
-                self._update_overall_status()
+                # Update overall status once the current burst is processed
+                self._schedule_overall_update()
         else:
             # Query-level status update
             key = f"{database_name}:{query_name}"
             if key in self.query_widgets:
-                status_widget = self.query_widgets[key]['status']
+                widget_entry = self.query_widgets[key]
                 
                 if status == "completed" and row_count is not None:
                     status_text = f"Complete ({row_count} rows)"
                 else:
-                    status_text = status.title()
+                    status_text = _STATUS_TITLES.get(status) or status.title()
                     
-                self._update_status_widget(status_widget, status, False, status_text)
+                self._update_status_widget(widget_entry, status, False, status_text)
                 
-    def _update_status_widget(self, widget, status: str, is_database: bool, custom_text: str = None):
-        """Update a status widget with appropriate color and text."""
-        # Define status colors
-        status_colors = {
-            "connecting": "orange",
-            "running": "blue",
-            "completed": "green",
-            "failed": "red",
-            "cancelled": "gray",
-            "idle": "gray"
-        }
-        
-        color = status_colors.get(status.lower(), "gray")
+    def _update_status_widget(self, widget_entry, status: str, is_database: bool, custom_text: str = None):
+        """Update a status widget entry with appropriate color and text."""
+        color = _STATUS_COLORS.get(status, "gray")
         
         if custom_text:
             text = custom_text
-        elif is_database:
-            text = f"Status: {status.title()}"
         else:
-            text = status.title()
+            title = _STATUS_TITLES.get(status) or status.title()
+            text = f"Status: {title}" if is_database else title
             
-        widget.configure(text=text, text_color=color)
+        self._set_status(widget_entry, text, color)
+        
+    def _set_status(self, widget_entry, text: str, color: str):
+        """Configure a status label only if its text or color changed."""
+        if widget_entry['last'] == (text, color):
+            return
+        widget_entry['status'].configure(text=text, text_color=color)
+        widget_entry['last'] = (text, color)
+        
+    def _schedule_overall_update(self):
+        """Coalesce overall status recomputation into one idle callback."""
+        if self._overall_update_pending:
+            return
+        self._overall_update_pending = True
+        self.after_idle(self._do_overall_update)
+        
+    def _do_overall_update(self):
+        """Run a scheduled overall status update."""
+        self._overall_update_pending = False
+        self._update_overall_status()
         
     def _update_overall_status(self):
         """Update the overall status based on all database statuses."""
         # Check all database statuses
-        all_statuses = []
-        for db_widgets in self.database_widgets.values():
-            status_text = db_widgets['status'].cget("text")
-            if ":" in status_text:
-                status = status_text.split(":")[1].strip().lower()
-                all_statuses.append(status)
-                
+        all_statuses = list(self._db_status.values())
+        
         # Determine overall status
         if any(s == "failed" for s in all_statuses):
             overall = "Failed"
@@ -183,26 +237,26 @@ class DatabaseStatusPanel(ctk.CTkFrame):
             overall = "Idle"
             color = "gray"
             
-        self.overall_status_label.configure(
-            text=f"Overall Status: {overall}",
-            text_color=color
-        )
+        self._set_overall_status(f"Overall Status: {overall}", color)
+        
+    def _set_overall_status(self, text: str, color: str):
+        """Configure the overall status label only if it changed."""
+        if self._last_overall == (text, color):
+            return
+        self.overall_status_label.configure(text=text, text_color=color)
+        self._last_overall = (text, color)
         
     def reset_all_status(self):
         """Reset all statuses to initial state."""
-        self.overall_status_label.configure(
-            text="Overall Status: Idle",
-            text_color="gray"
-        )
-        
-        for db_widgets in self.database_widgets.values():
-            db_widgets['status'].configure(
-                text="Status: Not Connected",
-                text_color="gray"
-            )
+        self._set_overall_status("Overall Status: Idle", "gray")
+        
+        for db_name in self.database_widgets:
+            self._db_status[db_name] = "not connected"
             
-        for query_widgets in self.query_widgets.values():
-            query_widgets['status'].configure(
-                text="Pending",
-                text_color="gray"
-            )
\ No newline at end of file
+        # Only relabel entries whose status actually changes
+        for widgets, text in (
+            (self.database_widgets, "Status: Not Connected"),
+            (self.query_widgets, "Pending"),
+        ):
+            for entry in widgets.values():
+                self._set_status(entry, text, "gray")
\ No newline at end of file
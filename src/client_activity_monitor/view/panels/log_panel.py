@@ -1,20 +1,55 @@
 import customtkinter as ctk
-from datetime import datetime
-from typing import Literal
+from collections import deque
+from typing import Deque, Literal
 import queue
-import threading
+import time
+
+# Maximum number of lines kept in the log widget
+MAX_LOG_LINES = 1000
+
+# Maximum number of queued entries appended per drain
+MAX_BATCH_SIZE = 500
+
+# Log level tag colors for each appearance mode
+_TAG_COLORS_LIGHT = {
+    "INFO": "black",
+    "SUCCESS": "green",
+    "WARNING": "orange",
+    "ERROR": "red",
+    "DEBUG": "gray",
+}
+_TAG_COLORS_DARK = {
+    "INFO": "white",
+    "SUCCESS": "light green",
+    "WARNING": "orange",
+    "ERROR": "tomato",
+    "DEBUG": "gray",
+}
 
 class LogPanel(ctk.CTkFrame):
     """
     Scrollable log panel for displaying application messages.
     """
     
-    def __init__(self, parent):
-        """Initialize the log panel."""
+    def __init__(self, parent, poll_ms: int = 50):
+        """
+        Initialize the log panel.
+        
+        Args:
+            parent: Parent widget
+            poll_ms: Interval in milliseconds between log queue drains
+        """
         super().__init__(parent)
         self.log_queue = queue.Queue()
+        self.poll_ms = poll_ms
+        # Lines currently in log_text, tracked here so trimming never has
+        # to read the widget's contents back from Tk
+        self._line_count = 0
+        # Python-side copy of recent entries used for saving to file
+        self._log_ring: Deque[str] = deque(maxlen=MAX_LOG_LINES)
         self._create_widgets()
-        self._start_log_updater()
+        # Id of the scheduled drain, cancelled when the panel is destroyed
+        self._drain_after_id = self.after(self.poll_ms, self._drain_log_queue)
         
     def _create_widgets(self):
         """Create the log panel UI."""
@@ -37,11 +72,18 @@ class LogPanel(ctk.CTkFrame):
         self.grid_columnconfigure(0, weight=1)
         
         # Configure text tags for different log levels
-        self.log_text.tag_config("INFO", foreground="black")
-        self.log_text.tag_config("SUCCESS", foreground="green")
-        self.log_text.tag_config("WARNING", foreground="orange")
-        self.log_text.tag_config("ERROR", foreground="red")
-        self.log_text.tag_config("DEBUG", foreground="gray")
+        self._apply_tag_colors(ctk.get_appearance_mode())
+        
+    def _apply_tag_colors(self, mode: str):
+        """Configure the log level tags for a "light" or "dark" appearance mode."""
+        colors = _TAG_COLORS_DARK if mode.lower() == "dark" else _TAG_COLORS_LIGHT
+        for level, color in colors.items():
+            self.log_text.tag_config(level, foreground=color)
+            
+    def _set_appearance_mode(self, mode_string):
+        """Recolor the log level tags when CustomTkinter switches theme."""
+        super()._set_appearance_mode(mode_string)
+        self._apply_tag_colors(mode_string)
         
     def log(
         self,
@@ -55,62 +97,71 @@ class LogPanel(ctk.CTkFrame):
             message: The message to log
             level: The log level for color coding
         """
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        log_entry = f"[{timestamp}] {message}"
+        t = time.localtime()
+        log_entry = f"[{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}] {message}"
         
         # Queue the log entry for thread-safe updates
         self.log_queue.put((log_entry, level))
+        self._log_ring.append(log_entry + "\n")
         
-    def _start_log_updater(self):
-        """Start a thread to update logs from the queue."""
-        def update_logs():
-            while True:
-                try:
-                    # Check for new log entries
-                    while not self.log_queue.empty():
-                        log_entry, level = self.log_queue.get_nowait()
-                        self._append_log(log_entry, level)
-                except queue.Empty:
-                    pass
-                    
-                # Small delay to prevent excessive CPU usage
-                threading.Event().wait(0.1)
+    def _drain_log_queue(self):
+        """Append queued log entries on the Tk main loop, then reschedule."""
+        batch = []
+        try:
+            while len(batch) < MAX_BATCH_SIZE:
+                batch.append(self.log_queue.get_nowait())
+        except queue.Empty:
+            pass
+            
+        try:
+            if batch:
+                self._append_logs(batch)
+        finally:
+            # Reschedule even if appending failed so log display continues.
+            # A full batch means entries are still waiting; drain again as
+            # soon as Tk is idle rather than after a full poll interval
+            if len(batch) == MAX_BATCH_SIZE:
+                self._drain_after_id = self.after_idle(self._drain_log_queue)
+            else:
+                self._drain_after_id = self.after(self.poll_ms, self._drain_log_queue)
                 
-        # Start updater thread as daemon
-        updater_thread = threading.Thread(target=update_logs, daemon=True)
-        updater_thread.start()
+    def destroy(self):
+        """Stop draining the log queue before the widget is destroyed."""
+        if self._drain_after_id is not None:
+            self.after_cancel(self._drain_after_id)
+            self._drain_after_id = None
+        super().destroy()
         
-    def _append_log(self, log_entry: str, level: str):
-        """Append a log entry to the text widget."""
-        # Enable text widget for editing
+    def _append_logs(self, entries):
+        """Append a batch of (log_entry, level) pairs to the text widget."""
+        # Enable text widget for editing once per batch
         self.log_text.configure(state="normal")
         
-        # Add log entry with appropriate tag
-        self.log_text.insert("end", log_entry + "\n", level)
-        
+        # Add each log entry with its level tag
+        for log_entry, level in entries:
+            self.log_text.insert("end", log_entry + "\n", level)
+            self._line_count += log_entry.count("\n") + 1
+            
+        # Limit log size (keep last MAX_LOG_LINES lines)
+        if self._line_count > MAX_LOG_LINES:
+            self.log_text.delete("1.0", f"{self._line_count - MAX_LOG_LINES + 1}.0")
+            self._line_count = MAX_LOG_LINES
+            
         # Auto-scroll to bottom
         self.log_text.see("end")
         
         # Disable text widget again
         self.log_text.configure(state="disabled")
         
-        # Limit log size (keep last 1000 lines)
-        content = self.log_text.get("1.0", "end-1c")
-        lines = content.split('\n')
-        if len(lines) > 1000:
-            # Remove oldest lines
-            self.log_text.configure(state="normal")
-            self.log_text.delete("1.0", f"{len(lines)-1000}.0")
-            self.log_text.configure(state="disabled")
-            
     def clear_logs(self):
         """Clear all log entries."""
         self.log_text.configure(state="normal")
         self.log_text.delete("1.0", "end")
         self.log_text.configure(state="disabled")
+        self._line_count = 0
+        self._log_ring.clear()
         
     def save_logs_to_file(self, filepath: str):
-        """Save current logs to a file."""
-        content = self.log_text.get("1.0", "end-1c")
-        with open(filepath, 'w') as f:
-            f.write(content)
\ No newline at end of file
+        """Save the most recent log entries to a file."""
+        with open(filepath, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            f.writelines(self._log_ring)
\ No newline at end of file
@@ -7,8 +7,12 @@ Run Report button, and report action buttons.
 
 import customtkinter as ctk
 from tkinter import messagebox
-from datetime import datetime
 from typing import Callable, Dict
+from ...common.validators import validate_datetime
+
+
+def _no_op():
+    """Default for report action callbacks that were not provided."""
 
 
 class RunAnalysisPanel(ctk.CTkFrame):
@@ -37,6 +41,13 @@ class RunAnalysisPanel(ctk.CTkFrame):
         """
         super().__init__(parent)
         self.callbacks = callbacks
+        
+        # Resolve report action callbacks once instead of on every click
+        self._on_generate_email = callbacks.get('on_generate_email', _no_op)
+        self._on_copy_excel_path = callbacks.get('on_copy_excel_path', _no_op)
+        self._on_copy_onenote = callbacks.get('on_copy_onenote', _no_op)
+        self._on_optional_save = callbacks.get('on_optional_save', _no_op)
+        
         self._create_widgets()
         # Leave the date/time field blank initially so the user must
         # enter a value in "YYYY-MM-DD HH:MM" format.
@@ -88,7 +99,7 @@ class RunAnalysisPanel(ctk.CTkFrame):
         self.email_button = ctk.CTkButton(
             self,
             text="Generate Email Report",
-            command=lambda: self.callbacks.get('on_generate_email', lambda: None)(),
+            command=self._on_generate_email,
             state="disabled",
             width=250
         )
@@ -97,7 +108,7 @@ class RunAnalysisPanel(ctk.CTkFrame):
         self.copy_excel_button = ctk.CTkButton(
             self,
             text="Copy Excel Path to Clipboard",
-            command=lambda: self.callbacks.get('on_copy_excel_path', lambda: None)(),
+            command=self._on_copy_excel_path,
             state="disabled",
             width=250
         )
@@ -106,7 +117,7 @@ class RunAnalysisPanel(ctk.CTkFrame):
         self.onenote_button = ctk.CTkButton(
             self,
             text="OneNote Entry to Clipboard",
-            command=lambda: self.callbacks.get('on_copy_onenote', lambda: None)(),
+            command=self._on_copy_onenote,
             state="disabled",
             width=250
         )
@@ -115,7 +126,7 @@ class RunAnalysisPanel(ctk.CTkFrame):
         self.optional_save_button = ctk.CTkButton(
             self,
             text="Optional Save Report",
-            command=lambda: self.callbacks.get('on_optional_save', lambda: None)(),
+            command=self._on_optional_save,
             state="disabled",
             width=250
         )
@@ -138,9 +149,8 @@ class RunAnalysisPanel(ctk.CTkFrame):
         last_event_time = self.datetime_entry.get().strip()
         
         # Validate datetime format
-        try:
-            datetime.strptime(last_event_time, "%Y-%m-%d %H:%M")
-        except ValueError:
+        is_valid, _ = validate_datetime(last_event_time)
+        if not is_valid:
             self._show_error("Invalid datetime format. Use YYYY-MM-DD HH:MM")
             return
             
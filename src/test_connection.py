@@ -1,21 +1,35 @@
 #!/usr/bin/env python3
 """Test Oracle database connection"""
 
+import io
+import sys
 import yaml
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from client_activity_monitor.model.repositories.ez_connect_oracle import OracleKerberosConnection
 
+# Prefer LibYAML's C parser when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
 # Setup logging
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 
-def test_database_connection(db_config, oracle_config):
-    """Test connection to a single database"""
-    print(f"\nTesting connection to: {db_config['name']}")
-    print("-" * 40)
+# Health-check statement; oracledb caches it per connection once parsed
+HEALTH_CHECK_SQL = "SELECT SYSDATE FROM DUAL"
+
+def test_database_connection(db_config, oracle_config, out=None):
+    """Test connection to a single database, writing progress to out"""
+    if out is None:
+        out = sys.stdout
+    print(f"\nTesting connection to: {db_config['name']}", file=out)
+    print("-" * 40, file=out)
     
     try:
         # Create connection with proper parameter structure
@@ -30,47 +44,58 @@ def test_database_connection(db_config, oracle_config):
         conn = OracleKerberosConnection(connection_params)
         
         # Connect
-        conn.connect()
-        print("✓ Connection established")
+        connection = conn.connect()
+        print("✓ Connection established", file=out)
         
-        # Test query
-        results = conn.execute_query("SELECT SYSDATE FROM DUAL")
-        print(f"✓ Database time: {results[0]['SYSDATE']}")
+        # Test query on one cursor, reading the single value directly
+        with connection.cursor() as cursor:
+            cursor.execute(HEALTH_CHECK_SQL)
+            db_time = cursor.fetchone()[0]
+        print(f"✓ Database time: {db_time}", file=out)
         
         # Check schema
         if db_config.get('default_schema'):
             schema = conn.get_current_schema()
-            print(f"✓ Current schema: {schema}")
+            print(f"✓ Current schema: {schema}", file=out)
         
         # Close connection
         conn.close()
-        print("✓ Connection closed successfully")
+        print("✓ Connection closed successfully", file=out)
         
         return True
         
     except Exception as e:
-        print(f"✗ Connection failed: {str(e)}")
+        print(f"✗ Connection failed: {str(e)}", file=out)
         return False
 
 def main():
     """Test all configured database connections"""
     # Load configurations
     with open('configs/app_settings.yaml', 'r') as f:
-        app_settings = yaml.safe_load(f)
+        app_settings = yaml.load(f, Loader=_Loader)
     
     with open('configs/databases.yaml', 'r') as f:
-        db_config = yaml.safe_load(f)
+        db_config = yaml.load(f, Loader=_Loader)
     
     oracle_config = app_settings['oracle_client']
     
     print("Oracle Connection Test")
     print("=" * 50)
     
-    # Test each database
+    # Test databases concurrently; each test buffers its own output so
+    # results print as whole blocks instead of interleaving
+    databases = db_config['databases']
     success_count = 0
-    for db in db_config['databases']:
-        if test_database_connection(db, oracle_config):
-            success_count += 1
+    with ThreadPoolExecutor(max_workers=max(1, min(16, len(databases)))) as executor:
+        futures = {}
+        for db in databases:
+            out = io.StringIO()
+            futures[executor.submit(test_database_connection, db, oracle_config, out)] = out
+            
+        for future in as_completed(futures):
+            print(futures[future].getvalue(), end="")
+            if future.result():
+                success_count += 1
     
     print("\n" + "=" * 50)
     print(f"Results: {success_count}/{len(db_config['databases'])} connections successful")
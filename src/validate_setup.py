@@ -3,10 +3,17 @@
 
 import os
 import sys
+import importlib.util
 import subprocess
 import yaml
 from pathlib import Path
 
+# Prefer LibYAML's C parser when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
 def check_python_version():
     """Check Python version"""
     version = sys.version_info
@@ -30,8 +37,15 @@ def check_oracle_client(instant_client_dir):
 def check_kerberos():
     """Check Kerberos setup"""
     try:
-        result = subprocess.run(['klist'], capture_output=True, text=True)
-        if result.returncode == 0 and 'Default principal:' in result.stdout:
+        # 'klist -s' prints nothing and exits 0 only if a valid ticket exists
+        result = subprocess.run(
+            ['klist', '-s'],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=False
+        )
+        if result.returncode == 0:
             print("✓ Kerberos ticket found")
             return True
         else:
@@ -47,10 +61,11 @@ def check_python_packages():
     missing = []
     
     for package in required:
-        try:
-            __import__(package)
+        # find_spec locates the package without executing it, so heavy
+        # imports such as oracledb are not loaded just to be checked
+        if importlib.util.find_spec(package) is not None:
             print(f"✓ {package} installed")
-        except ImportError:
+        else:
             print(f"✗ {package} not installed")
             missing.append(package)
     
@@ -68,7 +83,7 @@ def check_configurations():
         if Path(config_file).exists():
             try:
                 with open(config_file, 'r') as f:
-                    yaml.safe_load(f)
+                    yaml.load(f, Loader=_Loader)
                 print(f"✓ {config_file} valid")
             except Exception as e:
                 print(f"✗ {config_file} invalid: {e}")
@@ -98,7 +113,7 @@ def main():
     # Load user config
     try:
         with open('configs/app_settings.yaml', 'r') as f:
-            user_config = yaml.safe_load(f)
+            user_config = yaml.load(f, Loader=_Loader)
         instant_client_dir = user_config['oracle_client']['instant_client_dir']
     except Exception as e:
         print(f"Cannot read app_settings.yaml: {e}")
@@ -1,8 +1,96 @@
 import pytest
 from datetime import datetime, timedelta
+import numpy as np
 import pandas as pd
 from client_activity_monitor.model.services.merge_filter_service import MergeFilterService
 
+def _random_results(seed, order, n_users=60, rows=300):
+    """Build randomized results from several databases, including an unknown query."""
+    rng = np.random.default_rng(seed)
+    last_event_time = datetime(2024, 1, 15, 14, 0)
+    
+    def changes(n, columns=('user_id', 'change_timestamp'), extras=False):
+        df = pd.DataFrame({
+            columns[0]: [f"user{rng.integers(0, n_users)}" for _ in range(n)],
+            columns[1]: [
+                last_event_time - timedelta(minutes=int(minutes))
+                for minutes in rng.integers(-120, 60 * 30, n)
+            ]
+        })
+        if extras:
+            df['changed_by'] = [f"admin{rng.integers(0, 5)}" for _ in range(n)]
+            df['old_value'] = [f"old{i}" for i in range(n)]
+        if order != "unsorted":
+            df = df.sort_values(columns[1], ascending=order == "ascending", ignore_index=True)
+        return df
+        
+    database_results = {
+        "client_activity_analysis": {
+            "Get all email changes": changes(rows, extras=True),
+            "Get phone changes by client ID": changes(rows, ('USERID', 'change_time')),
+            "Get token changes": changes(rows)
+        },
+        "account_activity_analysis": {
+            "Get all password changes": changes(rows, extras=True),
+            "Get all email changes": changes(rows // 2),
+            "Unknown query": changes(10)
+        },
+        "empty_database": {
+            "Get token changes": pd.DataFrame()
+        }
+    }
+    return database_results, last_event_time
+
+def _reference_report(database_results, last_event_time):
+    """Build the expected report one row at a time, keeping each user's latest change per type."""
+    window_start = last_event_time - timedelta(hours=24)
+    change_types = MergeFilterService.REQUIRED_CHANGE_TYPES
+    extra_fields = MergeFilterService.EXTRA_REPORT_FIELDS
+    fields_by_type = {change_type: [] for change_type in change_types}
+    latest = {}
+    
+    for db_name, queries in database_results.items():
+        for query_name, df in queries.items():
+            change_type = MergeFilterService.CHANGE_TYPE_MAPPING.get(query_name)
+            if df.empty or change_type is None:
+                continue
+            df = df.rename(columns={'USERID': 'user_id', 'change_time': 'change_timestamp'})
+            fields_by_type[change_type] += [
+                col for col in extra_fields
+                if col in df.columns and col not in fields_by_type[change_type]
+            ]
+            for row in df.to_dict('records'):
+                timestamp = pd.Timestamp(row['change_timestamp'])
+                if not window_start <= timestamp <= last_event_time:
+                    continue
+                key = (row['user_id'], change_type)
+                if key not in latest or timestamp > latest[key][0]:
+                    latest[key] = (timestamp, db_name, row)
+                    
+    users = sorted(
+        user_id for user_id in {user_id for user_id, _ in latest}
+        if all((user_id, change_type) in latest for change_type in change_types)
+    )
+    report_rows = []
+    for user_id in users:
+        report_row = {'user_id': user_id}
+        for change_type in change_types:
+            timestamp, db_name, row = latest[(user_id, change_type)]
+            report_row[f'{change_type}_change_time'] = timestamp
+            report_row[f'{change_type}_source_db'] = db_name
+            for col in extra_fields:
+                if col in fields_by_type[change_type]:
+                    report_row[f'{change_type}_{col}'] = row.get(col, np.nan)
+        change_times = [report_row[f'{change_type}_change_time'] for change_type in change_types]
+        report_row['earliest_change'] = min(change_times)
+        report_row['latest_change'] = max(change_times)
+        report_row['change_window_hours'] = (
+            (report_row['latest_change'] - report_row['earliest_change']).total_seconds() / 3600
+        )
+        report_rows.append(report_row)
+        
+    return pd.DataFrame(report_rows)
+
 class TestEndToEnd:
     """Integration tests for complete workflow."""
     
@@ -138,4 +226,175 @@ class TestEndToEnd:
         
         # Only user1 should qualify (has all 4 changes)
         assert len(result) == 1
-        assert result.iloc[0]['user_id'] == 'user1'
\ No newline at end of file
+        assert result.iloc[0]['user_id'] == 'user1'
+        
+    def test_extra_fields_kept_when_all_null(self):
+        """Test extra fields follow the query columns, not their values."""
+        last_event_time = datetime(2024, 1, 15, 14, 0)
+        changes = {
+            'user_id': ['user1', 'user2'],
+            'change_timestamp': [
+                last_event_time - timedelta(hours=1),
+                last_event_time - timedelta(hours=2)
+            ]
+        }
+        
+        database_results = {
+            "client_activity_analysis": {
+                "Get all email changes": pd.DataFrame(changes),
+                "Get phone changes by client ID": pd.DataFrame(changes),
+                "Get token changes": pd.DataFrame(changes)
+            },
+            "account_activity_analysis": {
+                "Get all password changes": pd.DataFrame({**changes, 'changed_by': [None, None]})
+            }
+        }
+        
+        service = MergeFilterService()
+        result = service.process_results(database_results, last_event_time)
+        
+        assert len(result) == 2
+        assert 'password_changed_by' in result.columns
+        assert result['password_changed_by'].isna().all()
+        assert 'email_changed_by' not in result.columns
+        
+    def test_mixed_user_id_types(self):
+        """Test databases returning numeric and string user ids."""
+        last_event_time = datetime(2024, 1, 15, 14, 0)
+        timestamps = [
+            last_event_time - timedelta(hours=1),
+            last_event_time - timedelta(hours=2)
+        ]
+        
+        def changes(user_ids):
+            return pd.DataFrame({'user_id': user_ids, 'change_timestamp': timestamps})
+            
+        database_results = {
+            "client_activity_analysis": {
+                "Get all email changes": changes(['user1', 'user2']),
+                "Get phone changes by client ID": changes(['user1', 'user2']),
+                "Get token changes": changes(['user1', 'user2'])
+            },
+            "account_activity_analysis": {
+                "Get all password changes": changes([1, 2])
+            }
+        }
+        
+        service = MergeFilterService()
+        result = service.process_results(database_results, last_event_time)
+        
+        # Numeric and string ids never match each other
+        assert isinstance(result, pd.DataFrame)
+        assert len(result) == 0
+        
+        # Ids of both types that appear in every change type still qualify
+        for queries in database_results.values():
+            for query_name in queries:
+                queries[query_name] = changes(['user1', 2])
+                
+        result = service.process_results(database_results, last_event_time)
+        assert len(result) == 2
+        assert set(result['user_id']) == {'user1', 2}
+        
+    def test_null_user_ids_ignored(self):
+        """Test changes without a user_id never count as a qualifying user."""
+        last_event_time = datetime(2024, 1, 15, 14, 0)
+        changes = pd.DataFrame({
+            'user_id': ['user1', None, 'user2'],
+            'change_timestamp': [
+                last_event_time - timedelta(hours=1),
+                last_event_time - timedelta(hours=2),
+                last_event_time - timedelta(hours=3)
+            ]
+        })
+        
+        database_results = {
+            "client_activity_analysis": {
+                "Get all email changes": changes,
+                "Get phone changes by client ID": changes,
+                "Get token changes": changes
+            },
+            "account_activity_analysis": {
+                "Get all password changes": changes
+            }
+        }
+        
+        service = MergeFilterService()
+        window_changes, _ = service._combine_results(database_results, last_event_time)
+        qualifying = service._find_users_with_all_changes(window_changes)
+        assert qualifying['user_id'].notna().all()
+        assert qualifying['user_id'].nunique() == 2
+        
+        result = service.process_results(database_results, last_event_time)
+        assert list(result['user_id']) == ['user1', 'user2']
+
+    @pytest.mark.parametrize("order", ["ascending", "descending", "unsorted", "with_nat"])
+    def test_time_window_bounds(self, order):
+        """Test the window keeps rows exactly at both bounds for any row order."""
+        last_event_time = datetime(2024, 1, 15, 14, 0)
+        window_start = last_event_time - timedelta(hours=24)
+        timestamps = [
+            window_start - timedelta(seconds=1),
+            window_start,
+            window_start + timedelta(hours=12),
+            last_event_time,
+            last_event_time + timedelta(seconds=1)
+        ]
+        if order == "descending":
+            timestamps.reverse()
+        elif order == "unsorted":
+            timestamps = [timestamps[i] for i in (2, 4, 0, 3, 1)]
+        elif order == "with_nat":
+            timestamps.insert(2, pd.NaT)
+            
+        changes = pd.DataFrame({
+            'user_id': [f'user{i}' for i in range(len(timestamps))],
+            'change_timestamp': pd.to_datetime(timestamps)
+        })
+        
+        service = MergeFilterService()
+        result = service._filter_by_time_window(changes, last_event_time)
+        
+        assert sorted(result['change_timestamp']) == [
+            pd.Timestamp(window_start),
+            pd.Timestamp(window_start + timedelta(hours=12)),
+            pd.Timestamp(last_event_time)
+        ]
+        
+    @pytest.mark.parametrize("seed", range(5))
+    @pytest.mark.parametrize("order", ["unsorted", "ascending", "descending"])
+    def test_randomized_results_match_reference(self, seed, order):
+        """Test randomized multi-database results against a per-user reference."""
+        database_results, last_event_time = _random_results(seed, order)
+        expected = _reference_report(database_results, last_event_time)
+        originals = {
+            (db_name, query_name): df.copy()
+            for db_name, queries in database_results.items()
+            for query_name, df in queries.items()
+        }
+        
+        result = MergeFilterService().process_results(database_results, last_event_time)
+        pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+        
+        # The query results passed in are never modified
+        for (db_name, query_name), original in originals.items():
+            pd.testing.assert_frame_equal(database_results[db_name][query_name], original)
+        
+    @pytest.mark.parametrize("seed", range(3))
+    def test_randomized_arrow_results_match_reference(self, seed):
+        """Test Arrow-backed query results give the same report."""
+        pytest.importorskip("pyarrow")
+        database_results, last_event_time = _random_results(seed, "descending")
+        expected = _reference_report(database_results, last_event_time)
+        
+        arrow_results = {
+            db_name: {
+                query_name: df.convert_dtypes(dtype_backend='pyarrow')
+                for query_name, df in queries.items()
+            }
+            for db_name, queries in database_results.items()
+        }
+        result = MergeFilterService().process_results(arrow_results, last_event_time)
+        pd.testing.assert_frame_equal(
+            result.astype(object), expected.astype(object), check_dtype=False
+        )
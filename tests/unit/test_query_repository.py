@@ -3,6 +3,7 @@ from unittest.mock import Mock, patch, MagicMock
 import pandas as pd
 from datetime import datetime
 from client_activity_monitor.model.repositories.query_repository import QueryRepository
+from client_activity_monitor.model.repositories.ez_connect_oracle import OracleKerberosConnection
 
 class TestQueryRepository:
     """Test QueryRepository with mocked database connection."""
@@ -107,4 +108,75 @@ class TestQueryRepository:
                     'Test Query',
                     'non_existent.sql',
                     datetime(2024, 1, 1)
-                )
\ No newline at end of file
+                )
+
+class _FakeCursor:
+    """Minimal DB-API cursor returning canned rows."""
+    
+    def __init__(self, description, rows):
+        self.description = description
+        self._rows = rows
+        
+    def __enter__(self):
+        return self
+        
+    def __exit__(self, *exc_info):
+        return False
+        
+    def execute(self, sql, params):
+        pass
+        
+    def fetchall(self):
+        return self._rows
+
+class TestColumnarQuery:
+    """Test columnar fetching and the DataFrames built from it."""
+    
+    DESCRIPTION = [('USER_ID',), ('CHANGE_DATE',)]
+    ROWS = [
+        ('user1', datetime(2024, 1, 15, 10, 0)),
+        ('user2', datetime(2024, 1, 15, 11, 0)),
+    ]
+    
+    def _connection(self, description, rows):
+        connection = OracleKerberosConnection.__new__(OracleKerberosConnection)
+        connection.connection = Mock()
+        connection.connection.cursor.return_value = _FakeCursor(description, rows)
+        return connection
+        
+    def _execute(self, tmp_path, description, rows):
+        sql_file = tmp_path / "query.sql"
+        sql_file.write_text("SELECT user_id, change_date FROM changes")
+        repo = QueryRepository({}, 'TEST_DB')
+        repo.connection = self._connection(description, rows)
+        return repo.execute_query('Test Query', str(sql_file), datetime(2024, 1, 1))
+        
+    def test_columnar_rows(self):
+        """Test rows are returned as one tuple of values per column."""
+        columns, values = self._connection(self.DESCRIPTION, self.ROWS).execute_query_columnar("SELECT")
+        assert columns == ['USER_ID', 'CHANGE_DATE']
+        assert values == [('user1', 'user2'), tuple(row[1] for row in self.ROWS)]
+        
+    def test_columnar_no_rows(self):
+        """Test an empty result keeps its column names."""
+        columns, values = self._connection(self.DESCRIPTION, []).execute_query_columnar("SELECT")
+        assert columns == ['USER_ID', 'CHANGE_DATE']
+        assert values == [(), ()]
+        
+    def test_columnar_no_description(self):
+        """Test statements without a result set return nothing."""
+        assert self._connection(None, []).execute_query_columnar("BEGIN NULL; END;") == ([], [])
+        
+    def test_execute_query_rows(self, tmp_path):
+        """Test query results become a DataFrame with one column per field."""
+        df = self._execute(tmp_path, self.DESCRIPTION, self.ROWS)
+        assert list(df.columns) == ['USER_ID', 'CHANGE_DATE']
+        assert df['USER_ID'].tolist() == ['user1', 'user2']
+        assert pd.to_datetime(df['CHANGE_DATE']).tolist() == [row[1] for row in self.ROWS]
+        
+    @pytest.mark.parametrize("description", [DESCRIPTION, None])
+    def test_execute_query_empty(self, tmp_path, description):
+        """Test empty results give an empty DataFrame without columns."""
+        df = self._execute(tmp_path, description, [])
+        assert df.empty
+        assert len(df.columns) == 0
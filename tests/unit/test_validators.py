@@ -1,5 +1,5 @@
 import pytest
-from client_activity_monitor.common.validators import Validators
+from client_activity_monitor.common.validators import Validators, _EMAIL_RE, _is_valid_email
 
 class TestValidators:
     """Test validation functions."""
@@ -20,6 +20,7 @@ class TestValidators:
             "A12345678901",  # Too long
             "A-1234",  # Invalid character
             "123 45",  # Space
+            "A12345\n",  # Trailing newline
         ]
         for sid in invalid_sids:
             is_valid, error = Validators.validate_sid(sid)
@@ -73,8 +74,72 @@ class TestValidators:
             ["@domain.com"],  # Missing user
             ["user@domain"],  # Missing TLD
             ["user@domain.c"],  # TLD too short
+            ["a@domain.com\nb@domain.com", "bad"],  # Embedded newline
         ]
         for email_list in invalid_lists:
             is_valid, error = Validators.validate_email_list(email_list)
             assert is_valid is False
-            assert error is not None
\ No newline at end of file
+            assert error is not None
+            
+    def test_validate_email_list_bulk(self):
+        """Test bulk email validation agrees with per-item validation."""
+        assert Validators.validate_email_list_bulk(
+            ["user1@domain.com", " user2@domain.org "]
+        ) == (True, None)
+        
+        is_valid, error = Validators.validate_email_list_bulk(
+            ["user1@domain.com", "user@domain"]
+        )
+        assert is_valid is False
+        assert "user@domain" in error
+        
+        # A newline inside one entry must not stand in for a missing match
+        is_valid, error = Validators.validate_email_list_bulk(
+            ["a@domain.com\nb@domain.com", "bad"]
+        )
+        assert is_valid is False
+        
+        is_valid, error = Validators.validate_email_list_bulk([])
+        assert is_valid is False
+        
+    def test_validate_krb5_config(self, tmp_path):
+        """Test KRB5 config content check, including empty files."""
+        valid = tmp_path / "krb5.conf"
+        valid.write_text("[libdefaults]\n    default_realm = EXAMPLE.COM\n")
+        assert Validators.validate_krb5_config(str(valid)) == (True, None)
+        
+        empty = tmp_path / "empty.conf"
+        empty.write_text("")
+        is_valid, error = Validators.validate_krb5_config(str(empty))
+        assert is_valid is False
+        assert "[libdefaults]" in error
+        
+        is_valid, error = Validators.validate_krb5_config(str(tmp_path))
+        assert is_valid is False
+        
+    def test_validate_krb5_config_read_error_not_cached(self, tmp_path, monkeypatch):
+        """Test a read failure is re-checked once the file becomes readable."""
+        config = tmp_path / "krb5.conf"
+        config.write_text("[libdefaults]\n")
+        
+        def unreadable(*args, **kwargs):
+            raise PermissionError("denied")
+            
+        with monkeypatch.context() as patched:
+            patched.setattr("builtins.open", unreadable)
+            assert Validators.validate_krb5_config(str(config)) == (
+                False, "Cannot read KRB5 config file"
+            )
+            
+        # Same mtime and size, e.g. after a chmod
+        assert Validators.validate_krb5_config(str(config)) == (True, None)
+        
+    def test_email_fast_path_matches_regex(self):
+        """Test the structural email check agrees with the email regex."""
+        samples = [
+            "a@b.co", "a.b-c+d%e_f@host-1.example.org", "a@b.c0m", "a@.co",
+            "a@b..co", "a@b.com.", "a@b_c.com", "a@@b.com", "a b@c.com",
+            "é@b.com", "a@b.c", "a@b", "@b.com", "a@b.co\n",
+        ]
+        for email in samples:
+            assert _is_valid_email(email) == bool(_EMAIL_RE.fullmatch(email)), email